@@ -0,0 +1,12 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # State file paths in tvl_monitor.config are relative to the working directory.
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
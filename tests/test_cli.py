@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from tvl_monitor import cli, defillama, github, scheduling
+from tvl_monitor.config import HISTORY_FILE, LLAMA_CACHE_META_FILE, POLL_STATE_FILE, STATE_FILE
+from tvl_monitor.store import CSVStore
+
+from test_defillama import PAYLOAD, FakeResponse, FakeSession
+
+@pytest.fixture
+def run(workdir, monkeypatch):
+    monkeypatch.setattr(cli, "USE_TELEGRAM", False)
+    monkeypatch.setattr(github, "commit_to_github", lambda paths: True)
+
+    def check(*responses):
+        monkeypatch.setattr(defillama, "SESSION", FakeSession(*responses))
+        return cli.check_new_protocols(CSVStore())
+    return check
+
+@pytest.mark.parametrize("body", [b"[]", b'{"error": "x"}', b'[{"name": '])
+def test_bad_payload_records_failure_and_drops_validators(run, body):
+    assert not run(FakeResponse(200, body, {"ETag": '"bad"'}))
+    assert scheduling.load_backoff_state()["failures"] == 1
+    assert not os.path.exists(LLAMA_CACHE_META_FILE)
+    assert not os.path.exists(POLL_STATE_FILE)
+
+def test_bad_payload_is_refetched_unconditionally(run, monkeypatch):
+    assert not run(FakeResponse(200, b'{"error": "x"}', {"ETag": '"bad"'}))
+    session = FakeSession(FakeResponse(200, b'{"error": "x"}', {"ETag": '"bad"'}))
+    monkeypatch.setattr(defillama, "SESSION", session)
+    assert not cli.check_new_protocols(CSVStore())
+    assert session.requests == [{}]
+    assert scheduling.load_backoff_state()["failures"] == 2
+
+def test_successful_run_resets_backoff_and_saves_state(run, workdir):
+    # A blank first_seen in the committed history must not stop the run.
+    (workdir / HISTORY_FILE).write_text(
+        "name,tvl,chain,category,first_seen,last_seen\r\n"
+        "Beta,15000000,Solana,Derivatives,,2025-01-03T00:00:00\r\n",
+        newline="",
+    )
+    scheduling.record_failure()
+    assert run(FakeResponse(200, PAYLOAD))
+    assert not os.path.exists(scheduling.BACKOFF_STATE_FILE)
+    assert os.path.exists(POLL_STATE_FILE)
+    assert (workdir / STATE_FILE).read_bytes() == b"Alpha\r\n"
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from tvl_monitor import defillama
+from tvl_monitor.config import LLAMA_CACHE_FILE, LLAMA_CACHE_META_FILE
+
+PAYLOAD = b'[{"name": "Alpha", "tvl": 20000000, "chain": "Ethereum", "category": "Derivatives"}]'
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+class FakeSession:
+    """Stands in for SESSION, replaying canned responses and recording request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    def install(*responses):
+        session = FakeSession(*responses)
+        monkeypatch.setattr(defillama, "SESSION", session)
+        return session
+    return install
+
+def test_fetch_200_then_304_reuses_cache(workdir, fake_session):
+    session = fake_session(
+        FakeResponse(200, PAYLOAD, {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}),
+        FakeResponse(304),
+    )
+    assert defillama.fetch_protocols() == LLAMA_CACHE_FILE
+    assert session.requests[0] == {}
+
+    assert defillama.fetch_protocols() == LLAMA_CACHE_FILE
+    assert session.requests[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert [p["name"] for p in defillama.iter_protocols(LLAMA_CACHE_FILE)] == ["Alpha"]
+
+def test_fetch_skips_validators_without_cache_file(workdir, fake_session):
+    (workdir / LLAMA_CACHE_META_FILE).write_bytes(b'{"etag": "\\"v1\\""}')
+    session = fake_session(FakeResponse(200, PAYLOAD))
+    defillama.fetch_protocols()
+    assert session.requests[0] == {}
+
+def test_fetch_drops_meta_when_response_has_no_validators(workdir, fake_session):
+    fake_session(FakeResponse(200, PAYLOAD, {"ETag": '"v1"'}), FakeResponse(200, PAYLOAD))
+    defillama.fetch_protocols()
+    assert os.path.exists(LLAMA_CACHE_META_FILE)
+    defillama.fetch_protocols()
+    assert not os.path.exists(LLAMA_CACHE_META_FILE)
+
+def test_fetch_error_returns_none(workdir, fake_session):
+    fake_session(FakeResponse(503))
+    assert defillama.fetch_protocols() is None
+    assert not os.path.exists(LLAMA_CACHE_FILE)
+
+def test_protocol_fields_fills_missing_keys():
+    assert defillama.protocol_fields({"name": "Alpha"}) == ("Alpha", None, "N/A")
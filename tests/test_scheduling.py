@@ -0,0 +1,58 @@
+import time
+
+from tvl_monitor import scheduling
+from tvl_monitor.config import FAILURE_BACKOFF_MAX, MAX_POLL_INTERVAL, MIN_POLL_INTERVAL, POLL_BACKOFF_BASE
+
+def test_next_poll_interval_resets_on_new_alert(workdir):
+    scheduling.save_poll_state(MAX_POLL_INTERVAL)
+    assert scheduling.next_poll_interval([], found_new=True) == MIN_POLL_INTERVAL
+
+def test_next_poll_interval_grows_on_quiet_run(workdir):
+    scheduling.save_poll_state(MIN_POLL_INTERVAL)
+    assert scheduling.next_poll_interval([], found_new=False) == MIN_POLL_INTERVAL * POLL_BACKOFF_BASE
+
+def test_next_poll_interval_is_clamped(workdir):
+    scheduling.save_poll_state(MAX_POLL_INTERVAL)
+    assert scheduling.next_poll_interval([], found_new=False) == MAX_POLL_INTERVAL
+
+def test_next_poll_interval_capped_by_mean_arrival_gap(workdir):
+    scheduling.save_poll_state(MAX_POLL_INTERVAL)
+    first_seen = ["2025-01-01T00:00:00", "2025-01-01T01:00:00", "2025-01-01T02:00:00"]
+    assert scheduling.next_poll_interval(first_seen, found_new=False) == 3600
+
+def test_mean_arrival_gap_ignores_duplicates():
+    assert scheduling.mean_arrival_gap(["2025-01-01T00:00:00"] * 3) is None
+
+def test_mean_arrival_gap_skips_unparseable_timestamps():
+    first_seen = ["2025-01-01T00:00:00", "", None, "not a date", "2025-01-01T02:00:00"]
+    assert scheduling.mean_arrival_gap(first_seen) == 7200
+
+def test_poll_due(workdir, monkeypatch):
+    monkeypatch.delenv("GITHUB_EVENT_NAME", raising=False)
+    assert scheduling.poll_due()
+    scheduling.save_poll_state(MIN_POLL_INTERVAL)
+    assert not scheduling.poll_due()
+    monkeypatch.setenv("GITHUB_EVENT_NAME", "workflow_dispatch")
+    assert scheduling.poll_due()
+
+def test_failure_backoff_skips_next_run_and_resets(workdir):
+    assert not scheduling.backoff_active()
+    scheduling.record_failure()
+    state = scheduling.load_backoff_state()
+    assert state["failures"] == 1
+    # Even the first failure must outlast the gap to the next cron run.
+    assert state["next_allowed_ts"] - time.time() > MIN_POLL_INTERVAL
+    assert scheduling.backoff_active()
+    scheduling.reset_failures()
+    assert not scheduling.backoff_active()
+
+def test_failure_backoff_is_capped(workdir):
+    for _ in range(30):
+        scheduling.record_failure()
+    assert scheduling.load_backoff_state()["next_allowed_ts"] - time.time() <= FAILURE_BACKOFF_MAX
+
+def test_write_due_output(workdir, monkeypatch):
+    output = workdir / "github_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+    scheduling.write_due_output(False)
+    assert output.read_text() == "due=false\n"
@@ -0,0 +1,96 @@
+import pytest
+
+from tvl_monitor.config import HISTORY_FILE, JSON_STATE_FILE, STATE_FILE
+from tvl_monitor.store import (
+    CSVStore,
+    JSONStore,
+    SQLiteStore,
+    StateStore,
+    format_tvl,
+    save_state_files,
+    state_fingerprint,
+)
+
+HISTORY_CSV = (
+    "name,tvl,chain,category,first_seen,last_seen\r\n"
+    "Alpha,20000000,Ethereum,Derivatives,2025-01-01T00:00:00,2025-01-02T00:00:00\r\n"
+    "Beta,15000000.5,Solana,Derivatives,2025-01-03T00:00:00,2025-01-03T00:00:00\r\n"
+)
+
+@pytest.fixture
+def seeded(workdir):
+    (workdir / HISTORY_FILE).write_text(HISTORY_CSV, newline="")
+    (workdir / STATE_FILE).write_text("Alpha\r\nBeta\r\n", newline="")
+    return workdir
+
+def make_store(cls):
+    store = cls()
+    store.update_history([
+        ("Alpha", 25000000, "Ethereum", "Derivatives", "2025-02-01T00:00:00", "2025-02-01T00:00:00"),
+        ("Gamma", 30000000, "Arbitrum", "Derivatives", "2025-02-01T00:00:00", "2025-02-01T00:00:00"),
+    ])
+    return store
+
+def test_state_store_is_abstract():
+    with pytest.raises(TypeError):
+        StateStore()
+
+@pytest.mark.parametrize("cls", [CSVStore, SQLiteStore])
+def test_csv_backed_stores_produce_identical_files(seeded, cls):
+    store = make_store(cls)
+    files = store.serialize(store.load_alerts() | {"Gamma"})
+    store.close()
+    assert files[STATE_FILE] == b"Alpha\r\nBeta\r\nGamma\r\n"
+    assert files[HISTORY_FILE].decode("utf-8").splitlines() == [
+        "name,tvl,chain,category,first_seen,last_seen",
+        "Alpha,25000000,Ethereum,Derivatives,2025-01-01T00:00:00,2025-02-01T00:00:00",
+        "Beta,15000000.5,Solana,Derivatives,2025-01-03T00:00:00,2025-01-03T00:00:00",
+        "Gamma,30000000,Arbitrum,Derivatives,2025-02-01T00:00:00,2025-02-01T00:00:00",
+    ]
+
+def test_sqlite_round_trip_is_byte_identical(seeded):
+    store = SQLiteStore()
+    files = store.serialize(store.load_alerts())
+    store.close()
+    assert files[HISTORY_FILE] == HISTORY_CSV.encode("utf-8")
+
+def test_sqlite_reseeds_when_committed_csv_changes(seeded):
+    store = make_store(SQLiteStore)
+    files = store.serialize(store.load_alerts())
+    save_state_files(files)
+    store.saved(files)
+    store.close()
+
+    # Our own export must not trigger a reseed...
+    store = SQLiteStore()
+    assert len(store.history_rows()) == 3
+    store.close()
+
+    # ...but an external edit to the committed CSV wins over the cached DB.
+    (seeded / HISTORY_FILE).write_text(HISTORY_CSV, newline="")
+    store = SQLiteStore()
+    assert [row[0] for row in store.history_rows()] == ["Alpha", "Beta"]
+    store.close()
+
+def test_json_store_seeds_from_csv_and_round_trips(seeded):
+    store = make_store(JSONStore)
+    assert store.load_alerts() == {"Alpha", "Beta"}
+    assert sorted(store.first_seen_times()) == [
+        "2025-01-01T00:00:00", "2025-01-03T00:00:00", "2025-02-01T00:00:00",
+    ]
+    save_state_files(store.serialize(store.load_alerts() | {"Gamma"}))
+
+    reloaded = JSONStore()
+    assert reloaded.load_alerts() == {"Alpha", "Beta", "Gamma"}
+    assert reloaded.history["Alpha"]["tvl"] == 25000000
+    assert (seeded / JSON_STATE_FILE).read_bytes().startswith(b"{")
+
+def test_format_tvl():
+    assert format_tvl(30000000.0) == 30000000
+    assert format_tvl(1.5) == 1.5
+
+def test_state_fingerprint_ignores_last_seen_and_small_tvl_moves():
+    base = state_fingerprint({"A"}, [("A", 20_000_000, "Eth", "Derivatives", "t1", "t1")])
+    assert base == state_fingerprint({"A"}, [("A", 20_049_999, "Eth", "Derivatives", "t2", "t2")])
+    assert base != state_fingerprint({"A"}, [("A", 26_000_000, "Eth", "Derivatives", "t1", "t1")])
+    assert base != state_fingerprint({"A", "B"}, [("A", 20_000_000, "Eth", "Derivatives", "t1", "t1")])
@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+from tvl_monitor import telegram
+from tvl_monitor.telegram import chunk_messages
+
+def test_chunk_messages_joins_lines_up_to_limit():
+    assert chunk_messages(["ab", "cd", "ef"], limit=6) == ["ab\n\ncd", "ef"]
+
+def test_chunk_messages_splits_oversized_line():
+    assert chunk_messages(["x", "aaaaaaa", "b"], limit=3) == ["x", "aaa", "aaa", "a", "b"]
+
+def test_chunk_messages_empty():
+    assert chunk_messages([]) == []
+
+def test_chunk_messages_respects_telegram_limit():
+    lines = ["m" * 1000] * 10
+    chunks = chunk_messages(lines)
+    assert all(len(chunk) <= telegram.TELEGRAM_MAX_LENGTH for chunk in chunks)
+    assert "\n\n".join(chunks) == "\n\n".join(lines)
+
+def test_send_all_keeps_chunk_order_per_chat(monkeypatch):
+    sent = []
+
+    def fake_post(chat_id, text):
+        # Make the first chunk the slowest so a concurrent send would reorder.
+        time.sleep(0.05 if text == "1" else 0)
+        sent.append((chat_id, text))
+
+    monkeypatch.setattr(telegram, "CHAT_IDS", ("a", "b"))
+    monkeypatch.setattr(telegram, "_post_telegram", fake_post)
+    asyncio.run(telegram.send_all(["1", "2", "3"]))
+
+    for chat_id in ("a", "b"):
+        assert [text for cid, text in sent if cid == chat_id] == ["1", "2", "3"]
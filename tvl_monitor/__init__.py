@@ -0,0 +1,24 @@
+from .cli import check_new_protocols, main
+from .store import CSVStore, JSONStore, SQLiteStore, StateStore
+
+__all__ = [
+    "CSVStore",
+    "JSONStore",
+    "SQLiteStore",
+    "StateStore",
+    "check_new_protocols",
+    "fetch_protocols",
+    "main",
+    "send_telegram_message",
+]
+
+def __getattr__(name):
+    # These pull in requests; resolve them on first use so importing the
+    # package (and the skipped-run path through main) stays cheap.
+    if name == "fetch_protocols":
+        from .defillama import fetch_protocols
+        return fetch_protocols
+    if name == "send_telegram_message":
+        from .telegram import send_telegram_message
+        return send_telegram_message
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,142 @@
+import argparse
+import sys
+
+from .config import CATEGORY_FILTER, TVL_THRESHOLD, USE_TELEGRAM
+from .scheduling import (
+    backoff_active,
+    next_poll_interval,
+    poll_due,
+    record_failure,
+    reset_failures,
+    save_poll_state,
+    write_due_output,
+)
+from .store import STORES, load_state_hash, save_state_files, save_state_hash, state_fingerprint
+
+def check_new_protocols(store):
+    # Deferred so runs that exit in main() on the backoff/poll checks never
+    # import requests or dulwich.
+    from datetime import datetime
+
+    from .defillama import discard_llama_cache_meta, fetch_protocols, iter_protocols, protocol_fields
+    from .github import commit_to_github
+    from .telegram import chunk_messages, send_all
+
+    alerted = store.load_alerts()
+    source = fetch_protocols()
+    new_alerts = set()
+    pending_lines = []
+    current_time = datetime.utcnow().isoformat()
+
+    if not source:
+        print("⚠️ No protocols fetched, exiting")
+        record_failure()
+        return False
+    history_rows = []
+
+    category_filter = CATEGORY_FILTER
+    tvl_threshold = TVL_THRESHOLD
+    fetched = 0
+    above_threshold = 0
+    category = category_filter
+    try:
+        for protocol in iter_protocols(source):
+            fetched += 1
+            if protocol.get("category") != category_filter:
+                continue
+            name, tvl, chain = protocol_fields(protocol)
+            if not isinstance(tvl, (int, float)) or tvl < tvl_threshold:
+                continue
+            above_threshold += 1
+            name = name.strip()
+            if not name:
+                continue
+
+            history_rows.append((name, tvl, chain, category, current_time, current_time))
+
+            if name not in alerted:
+                msg = (
+                    f"🚨 New Derivative Protocol Alert!\n"
+                    f"Name: {name}\nTVL: ${tvl:,.0f}\nChain: {chain}\nCategory: {category}"
+                )
+                print(msg)
+                pending_lines.append(msg)
+                new_alerts.add(name)
+                alerted.add(name)
+    except Exception as e:
+        print(f"❌ Error parsing protocols: {e}")
+        discard_llama_cache_meta()
+        record_failure()
+        return False
+
+    if not fetched:
+        print("⚠️ No protocols fetched, exiting")
+        discard_llama_cache_meta()
+        record_failure()
+        return False
+    reset_failures()
+
+    history_saved = store.update_history(history_rows)
+
+    if USE_TELEGRAM and pending_lines:
+        # asyncio pulls in subprocess, so only load it when there is something to send.
+        import asyncio
+
+        asyncio.run(send_all(chunk_messages(pending_lines)))
+
+    # Scheduled after the send so a problem computing the next interval can
+    # never hold back alerts.
+    save_poll_state(next_poll_interval(store.first_seen_times(), bool(new_alerts)))
+
+    if new_alerts:
+        print(f"🎉 Found {len(new_alerts)} new protocols crossing the threshold!")
+    else:
+        print("✅ No new protocols crossed the threshold")
+
+    # The store keeps last_seen/TVL current on its own; the committed files are
+    # only re-exported when the fingerprint moves, so quiet runs skip the
+    # serialization, the write and the commit.
+    state_hash = state_fingerprint(alerted, history_rows)
+    if state_hash == load_state_hash():
+        print("ℹ️ State unchanged - skipping save and commit")
+        state_saved = commit_success = True
+    else:
+        files = store.serialize(alerted)
+        state_saved = save_state_files(files)
+        if state_saved:
+            store.saved(files)
+        commit_success = state_saved and commit_to_github(list(files))
+        if commit_success:
+            save_state_hash(state_hash)
+
+    print(f"📊 Total derivatives protocols above ${TVL_THRESHOLD:,}: {above_threshold}")
+
+    return history_saved and state_saved and commit_success
+
+def main(argv=None, store="sqlite"):
+    parser = argparse.ArgumentParser(description="Alert on new DeFiLlama derivatives protocols crossing the TVL threshold.")
+    parser.add_argument("--store", choices=sorted(STORES), default=store, help="state backend (default: %(default)s)")
+    parser.add_argument(
+        "--check-due",
+        action="store_true",
+        help="only report whether a poll is due (as due=true/false in GITHUB_OUTPUT) and exit",
+    )
+    args = parser.parse_args(argv)
+
+    due = not backoff_active() and poll_due()
+    if args.check_due:
+        write_due_output(due)
+        sys.exit(0)
+    if not due:
+        sys.exit(0)
+    if not USE_TELEGRAM:
+        print("❌ Telegram configuration is missing.")
+    state_store = STORES[args.store]()
+    try:
+        success = check_new_protocols(state_store)
+    finally:
+        state_store.close()
+    if not success:
+        print("❌ Script completed with errors")
+        sys.exit(1)
+    print("✅ Script completed successfully")
@@ -0,0 +1,38 @@
+import os
+
+# === Config ===
+TVL_THRESHOLD = 10_000_000
+CATEGORY_FILTER = "Derivatives"
+DEFI_LLAMA_URL = "https://api.llama.fi/protocols"
+STATE_FILE = "notified_protocols.csv"
+HISTORY_FILE = "protocol_history.csv"
+HISTORY_DB = "history.db"
+JSON_STATE_FILE = "protocol_state.json"
+LLAMA_CACHE_FILE = "llama_cache.json"
+LLAMA_CACHE_META_FILE = "llama_cache.json.meta"
+POLL_STATE_FILE = ".poll_state"
+BACKOFF_STATE_FILE = ".backoff_state"
+STATE_HASH_FILE = ".state_hash"
+REPO_BRANCH = "main"
+GIT_IDENTITY = b"github-actions <github-actions@github.com>"
+TELEGRAM_MAX_LENGTH = 4096
+
+# === Polling Cadence ===
+# The workflow fires every MIN_POLL_INTERVAL on weekdays; the script decides
+# whether a run is due, stretching the gap by POLL_BACKOFF_BASE on quiet runs.
+# MAX_POLL_INTERVAL matches the original once-a-weekday schedule, so a quiet
+# steady state polls no more often than before.
+MIN_POLL_INTERVAL = 10 * 60
+MAX_POLL_INTERVAL = 24 * 60 * 60
+POLL_BACKOFF_BASE = 1.3
+# After a failed fetch the next attempt waits
+# MIN_POLL_INTERVAL * FAILURE_BACKOFF_BASE ** failures, so even the first
+# failure skips at least one scheduled run.
+FAILURE_BACKOFF_BASE = 1.3
+FAILURE_BACKOFF_MAX = 60 * 60
+
+# === Telegram Config ===
+BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
+CHAT_IDS = tuple(c.strip() for c in os.getenv("TELEGRAM_CHAT_IDS", "").split(",") if c.strip())
+TELEGRAM_URL = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+USE_TELEGRAM = bool(BOT_TOKEN and CHAT_IDS)
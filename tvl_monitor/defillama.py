@@ -0,0 +1,81 @@
+import os
+from operator import itemgetter
+
+from .config import DEFI_LLAMA_URL, LLAMA_CACHE_FILE, LLAMA_CACHE_META_FILE
+from .session import SESSION
+from .utils import json_dumps, json_loads, load_json_file
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def load_llama_cache_meta():
+    if not os.path.exists(LLAMA_CACHE_FILE):
+        return {}
+    return load_json_file(LLAMA_CACHE_META_FILE, {}, "cache metadata")
+
+def discard_llama_cache_meta():
+    # Without validators the next fetch is unconditional, so a cached body
+    # that turned out to be bad is not replayed through 304s.
+    try:
+        if os.path.exists(LLAMA_CACHE_META_FILE):
+            os.remove(LLAMA_CACHE_META_FILE)
+    except Exception as e:
+        print(f"❌ Error removing DeFiLlama cache metadata: {e}")
+
+def save_llama_cache_meta(res):
+    meta = {
+        "etag": res.headers.get("ETag"),
+        "last_modified": res.headers.get("Last-Modified"),
+    }
+    try:
+        if not any(meta.values()):
+            discard_llama_cache_meta()
+            return
+        with open(LLAMA_CACHE_META_FILE, "wb") as f:
+            f.write(json_dumps(meta))
+    except Exception as e:
+        print(f"❌ Error saving DeFiLlama cache metadata: {e}")
+
+# Streams the payload to LLAMA_CACHE_FILE and returns its path so the
+# protocol list is parsed incrementally instead of held in memory.
+def fetch_protocols():
+    try:
+        print("🔍 Fetching DeFiLlama protocols...")
+        meta = load_llama_cache_meta()
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        with SESSION.get(DEFI_LLAMA_URL, headers=headers, timeout=30, stream=True) as res:
+            if res.status_code == 304:
+                print("ℹ️ DeFiLlama data unchanged, using cached response")
+                return LLAMA_CACHE_FILE
+            res.raise_for_status()
+            tmp_path = LLAMA_CACHE_FILE + ".tmp"
+            with open(tmp_path, "wb") as f:
+                for chunk in res.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            os.replace(tmp_path, LLAMA_CACHE_FILE)
+            save_llama_cache_meta(res)
+        return LLAMA_CACHE_FILE
+    except Exception as e:
+        print(f"❌ Error fetching protocols: {e}")
+        return None
+
+def iter_protocols(path):
+    with open(path, "rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from json_loads(f.read())
+
+_protocol_fields = itemgetter("name", "tvl", "chain")
+
+def protocol_fields(protocol):
+    try:
+        return _protocol_fields(protocol)
+    except KeyError:
+        return protocol.get("name", ""), protocol.get("tvl"), protocol.get("chain", "N/A")
@@ -0,0 +1,57 @@
+import os
+
+from .config import GIT_IDENTITY, REPO_BRANCH
+
+def commit_in_process(porcelain, paths, commit_message):
+    porcelain.add(".", paths)
+    if not any(porcelain.status(".").staged.values()):
+        return False
+    porcelain.commit(".", message=commit_message.encode("utf-8"), author=GIT_IDENTITY, committer=GIT_IDENTITY)
+    return True
+
+def commit_with_git_cli(paths, commit_message):
+    import subprocess
+
+    subprocess.run(["git", "config", "--global", "user.name", "github-actions"], check=True)
+    subprocess.run(["git", "config", "--global", "user.email", "github-actions@github.com"], check=True)
+    subprocess.run(["git", "add", *paths], check=True)
+    status = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
+    if not status.stdout.strip():
+        return False
+    subprocess.run(["git", "commit", "-m", commit_message], check=True)
+    return True
+
+def commit_to_github(paths):
+    if os.getenv("GITHUB_ACTIONS") != "true":
+        print("ℹ️ Not in GitHub Actions - skipping commit")
+        return False
+    # Only needed on the CI path, so local and skipped runs don't pay for them;
+    # dulwich alone pulls in subprocess and costs ~60ms to import.
+    import subprocess
+    from datetime import datetime
+
+    try:
+        from dulwich import porcelain
+    except ImportError:
+        porcelain = None
+
+    try:
+        commit_message = f"Update protocol data {datetime.utcnow().isoformat()}"
+        if porcelain is not None:
+            committed = commit_in_process(porcelain, paths, commit_message)
+        else:
+            committed = commit_with_git_cli(paths, commit_message)
+        if not committed:
+            print("ℹ️ No changes to commit")
+            return False
+        # Push through the git CLI so the credentials actions/checkout
+        # configured for the remote are picked up.
+        subprocess.run(["git", "push", "origin", f"HEAD:{REPO_BRANCH}"], check=True)
+        print("🚀 Changes pushed to GitHub")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Git command failed: {e}\nCommand: {e.cmd}\nOutput: {e.stdout}\nError: {e.stderr}")
+        return False
+    except Exception as e:
+        print(f"❌ Error committing to GitHub: {e}")
+        return False
@@ -0,0 +1,95 @@
+import os
+import time
+
+from .config import (
+    BACKOFF_STATE_FILE,
+    FAILURE_BACKOFF_BASE,
+    FAILURE_BACKOFF_MAX,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    POLL_BACKOFF_BASE,
+    POLL_STATE_FILE,
+)
+from .utils import json_dumps, load_json_file
+
+def load_poll_state():
+    return load_json_file(POLL_STATE_FILE, {}, "poll state")
+
+def poll_due():
+    if os.getenv("GITHUB_EVENT_NAME") == "workflow_dispatch":
+        return True
+    next_poll_ts = load_poll_state().get("next_poll_ts", 0)
+    if time.time() < next_poll_ts:
+        wait = int(next_poll_ts - time.time())
+        print(f"⏳ Next poll due in {wait // 60} min, skipping this run")
+        return False
+    return True
+
+def parse_timestamps(values):
+    from datetime import datetime
+
+    # first_seen comes from a hand-editable CSV; a blank or malformed cell
+    # should only drop out of the estimate, not abort the run.
+    for ts in values:
+        try:
+            yield datetime.fromisoformat(ts)
+        except (TypeError, ValueError):
+            continue
+
+def mean_arrival_gap(first_seen_times):
+    first_seen = sorted(set(parse_timestamps(first_seen_times)))
+    if len(first_seen) < 2:
+        return None
+    return (first_seen[-1] - first_seen[0]).total_seconds() / (len(first_seen) - 1)
+
+def next_poll_interval(first_seen_times, found_new):
+    if found_new:
+        interval = MIN_POLL_INTERVAL
+    else:
+        interval = load_poll_state().get("interval", MIN_POLL_INTERVAL) * POLL_BACKOFF_BASE
+        gap = mean_arrival_gap(first_seen_times)
+        if gap is not None:
+            interval = min(interval, gap)
+    return max(MIN_POLL_INTERVAL, min(interval, MAX_POLL_INTERVAL))
+
+def save_poll_state(interval):
+    try:
+        with open(POLL_STATE_FILE, "wb") as f:
+            f.write(json_dumps({"interval": interval, "next_poll_ts": time.time() + interval}))
+        print(f"⏱️ Next poll in {int(interval) // 60} min")
+    except Exception as e:
+        print(f"❌ Error saving poll state: {e}")
+
+def load_backoff_state():
+    return load_json_file(BACKOFF_STATE_FILE, {"failures": 0, "next_allowed_ts": 0}, "backoff state")
+
+def backoff_active():
+    next_allowed_ts = load_backoff_state().get("next_allowed_ts", 0)
+    if time.time() < next_allowed_ts:
+        wait = int(next_allowed_ts - time.time())
+        print(f"⏳ Backing off after failures, next attempt in {wait // 60} min")
+        return True
+    return False
+
+def record_failure():
+    failures = load_backoff_state().get("failures", 0) + 1
+    delay = min(MIN_POLL_INTERVAL * FAILURE_BACKOFF_BASE ** failures, FAILURE_BACKOFF_MAX)
+    try:
+        with open(BACKOFF_STATE_FILE, "wb") as f:
+            f.write(json_dumps({"failures": failures, "next_allowed_ts": time.time() + delay}))
+        print(f"⚠️ Failure #{failures}, backing off for {int(delay)}s")
+    except Exception as e:
+        print(f"❌ Error saving backoff state: {e}")
+
+def reset_failures():
+    if os.path.exists(BACKOFF_STATE_FILE):
+        try:
+            os.remove(BACKOFF_STATE_FILE)
+        except Exception as e:
+            print(f"❌ Error clearing backoff state: {e}")
+
+def write_due_output(due):
+    github_output = os.getenv("GITHUB_OUTPUT")
+    if github_output:
+        with open(github_output, "a", encoding="utf-8") as f:
+            f.write(f"due={'true' if due else 'false'}\n")
@@ -0,0 +1,38 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# === HTTP Session ===
+# One pooled session for the whole run so Telegram/DeFiLlama calls reuse
+# keep-alive connections instead of paying a new TLS handshake each time.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
+# sendMessage is not idempotent: after a read timeout or a 5xx the message
+# may already be delivered, so only retry when Telegram never got it
+# (connect errors) or explicitly asked us to come back later (429).
+SESSION.mount("https://api.telegram.org/", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=0,
+        other=0,
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=[429],
+        allowed_methods=frozenset({"POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    ),
+))
@@ -0,0 +1,278 @@
+from abc import ABC, abstractmethod
+import hashlib
+import io
+import os
+import sqlite3
+
+from .config import HISTORY_DB, HISTORY_FILE, JSON_STATE_FILE, STATE_FILE, STATE_HASH_FILE
+from .utils import json_dumps, load_json_file, write_atomically
+
+HISTORY_FIELDS = ["name", "tvl", "chain", "category", "first_seen", "last_seen"]
+
+def load_previous_alerts():
+    import csv
+
+    if not os.path.exists(STATE_FILE):
+        print("ℹ️ No existing alert state found.")
+        return set()
+    try:
+        with open(STATE_FILE, "r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            return {row[0] for row in reader if row}
+    except Exception as e:
+        print(f"❌ Error loading state file: {e}")
+        return set()
+
+def load_protocol_history():
+    import csv
+
+    history = {}
+    if not os.path.exists(HISTORY_FILE):
+        print("ℹ️ No protocol history file found.")
+        return history
+    try:
+        with open(HISTORY_FILE, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                history[row["name"]] = {
+                    "tvl": float(row["tvl"]),
+                    "chain": row["chain"],
+                    "category": row["category"],
+                    "first_seen": row["first_seen"],
+                    "last_seen": row["last_seen"]
+                }
+        print(f"ℹ️ Loaded {len(history)} protocols from history")
+    except Exception as e:
+        print(f"❌ Error loading history file: {e}")
+    return history
+
+def merge_history(history, rows):
+    for name, tvl, chain, category, first_seen, last_seen in rows:
+        if name in history:
+            history[name]["tvl"] = tvl
+            history[name]["last_seen"] = last_seen
+        else:
+            history[name] = {"tvl": tvl, "chain": chain, "category": category, "first_seen": first_seen, "last_seen": last_seen}
+
+def history_rows(history):
+    return (
+        (name, d["tvl"], d["chain"], d["category"], d["first_seen"], d["last_seen"])
+        for name, d in history.items()
+    )
+
+def serialize_alerts(protocols):
+    import csv
+
+    buf = io.StringIO(newline="")
+    csv.writer(buf).writerows([name] for name in sorted(protocols))
+    return buf.getvalue().encode("utf-8")
+
+def format_tvl(tvl):
+    # SQLite hands REAL columns back as floats; write whole numbers the same
+    # way the API-sourced ints are written so backends produce identical CSVs.
+    return int(tvl) if float(tvl).is_integer() else tvl
+
+def serialize_protocol_history(rows):
+    import csv
+
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(HISTORY_FIELDS)
+    writer.writerows((name, format_tvl(tvl), *rest) for name, tvl, *rest in rows)
+    return buf.getvalue().encode("utf-8")
+
+class StateStore(ABC):
+    """Persistence backend for alerted protocol names and protocol history.
+
+    History rows are ``(name, tvl, chain, category, first_seen, last_seen)``
+    tuples; ``serialize`` returns the files the store persists as a
+    ``{path: bytes}`` mapping so the caller can hash, write and commit them.
+    """
+
+    @abstractmethod
+    def load_alerts(self):
+        ...
+
+    @abstractmethod
+    def update_history(self, rows):
+        ...
+
+    @abstractmethod
+    def first_seen_times(self):
+        ...
+
+    @abstractmethod
+    def serialize(self, alerted):
+        ...
+
+    def saved(self, files):
+        pass
+
+    def close(self):
+        pass
+
+class _InMemoryHistoryStore(StateStore):
+    """Shared history handling for stores that keep ``self.history`` as a dict."""
+
+    def update_history(self, rows):
+        merge_history(self.history, rows)
+        print(f"💾 Updated {len(rows)} protocols in history")
+        return True
+
+    def first_seen_times(self):
+        return [data["first_seen"] for data in self.history.values()]
+
+class CSVStore(_InMemoryHistoryStore):
+    """Keep alerts and history in the committed CSV files."""
+
+    def __init__(self):
+        self.history = load_protocol_history()
+
+    def load_alerts(self):
+        return load_previous_alerts()
+
+    def serialize(self, alerted):
+        return {
+            STATE_FILE: serialize_alerts(alerted),
+            HISTORY_FILE: serialize_protocol_history(history_rows(self.history)),
+        }
+
+def file_sha256(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+class SQLiteStore(StateStore):
+    """Keep history in SQLite, touching only the rows seen in each run.
+
+    The committed history CSV stays authoritative: the database remembers
+    the hash of the CSV it last matched and reseeds itself whenever the
+    file on disk differs, e.g. after a manual edit or a run elsewhere.
+    """
+
+    def __init__(self):
+        self.conn = sqlite3.connect(HISTORY_DB)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS protocols("
+            "name TEXT PRIMARY KEY, tvl REAL, chain TEXT, category TEXT, first_seen TEXT, last_seen TEXT)"
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta(key TEXT PRIMARY KEY, value TEXT)")
+        csv_hash = file_sha256(HISTORY_FILE)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'history_csv_sha256'").fetchone()
+        empty = self.conn.execute("SELECT 1 FROM protocols LIMIT 1").fetchone() is None
+        if empty or (csv_hash is not None and (row is None or row[0] != csv_hash)):
+            with self.conn:
+                self.conn.execute("DELETE FROM protocols")
+                self.conn.executemany(
+                    "INSERT INTO protocols(name, tvl, chain, category, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?)",
+                    history_rows(load_protocol_history())
+                )
+                self._set_csv_hash(csv_hash)
+
+    def load_alerts(self):
+        return load_previous_alerts()
+
+    def _set_csv_hash(self, csv_hash):
+        self.conn.execute(
+            "INSERT INTO meta(key, value) VALUES ('history_csv_sha256', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            (csv_hash,)
+        )
+
+    def update_history(self, rows):
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT INTO protocols(name, tvl, chain, category, first_seen, last_seen) VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET tvl=excluded.tvl, last_seen=excluded.last_seen",
+                    rows
+                )
+            print(f"💾 Updated {len(rows)} protocols in history")
+            return True
+        except Exception as e:
+            print(f"❌ Error updating history database: {e}")
+            return False
+
+    def first_seen_times(self):
+        return [ts for (ts,) in self.conn.execute("SELECT DISTINCT first_seen FROM protocols")]
+
+    def history_rows(self):
+        return self.conn.execute(
+            "SELECT name, tvl, chain, category, first_seen, last_seen FROM protocols ORDER BY rowid"
+        ).fetchall()
+
+    def serialize(self, alerted):
+        return {
+            STATE_FILE: serialize_alerts(alerted),
+            HISTORY_FILE: serialize_protocol_history(self.history_rows()),
+        }
+
+    def saved(self, files):
+        with self.conn:
+            self._set_csv_hash(hashlib.sha256(files[HISTORY_FILE]).hexdigest())
+
+    def close(self):
+        self.conn.close()
+
+class JSONStore(_InMemoryHistoryStore):
+    """Keep alerts and history together in a single JSON document."""
+
+    def __init__(self):
+        state = load_json_file(JSON_STATE_FILE, None, "JSON state file")
+        if state is None:
+            state = {"alerted": sorted(load_previous_alerts()), "history": load_protocol_history()}
+        self.alerted = set(state["alerted"])
+        self.history = state["history"]
+
+    def load_alerts(self):
+        return set(self.alerted)
+
+    def serialize(self, alerted):
+        return {JSON_STATE_FILE: json_dumps({"alerted": sorted(alerted), "history": self.history}, indent=True)}
+
+STORES = {
+    "csv": CSVStore,
+    "json": JSONStore,
+    "sqlite": SQLiteStore,
+}
+
+def save_state_files(files):
+    try:
+        for path, data in files.items():
+            write_atomically(path, data)
+        print(f"💾 Saved state to {', '.join(files)}")
+        return True
+    except Exception as e:
+        print(f"❌ Error saving state files: {e}")
+        return False
+
+def state_fingerprint(alerted, rows):
+    # last_seen moves and TVL drifts on every poll, so hashing them would make
+    # every run look like a change. Fingerprint what matters for the committed
+    # state instead: the alerted names plus each seen protocol's TVL rounded
+    # to two significant figures.
+    digest = hashlib.sha256()
+    for name in sorted(alerted):
+        digest.update(f"{name}\0".encode("utf-8"))
+    digest.update(b"\1")
+    for name, tvl, *_ in sorted(rows):
+        digest.update(f"{name}\0{tvl:.2g}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+def load_state_hash():
+    if not os.path.exists(STATE_HASH_FILE):
+        return None
+    try:
+        with open(STATE_HASH_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except Exception as e:
+        print(f"❌ Error loading state hash: {e}")
+        return None
+
+def save_state_hash(state_hash):
+    try:
+        with open(STATE_HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(state_hash)
+    except Exception as e:
+        print(f"❌ Error saving state hash: {e}")
@@ -0,0 +1,59 @@
+from .config import CHAT_IDS, TELEGRAM_MAX_LENGTH, TELEGRAM_URL
+from .session import SESSION
+
+def _post_telegram(chat_id, text):
+    try:
+        res = SESSION.post(
+            TELEGRAM_URL,
+            data={"chat_id": chat_id, "text": text},
+            timeout=10
+        )
+        if res.status_code == 200:
+            print(f"✅ Message sent to {chat_id}")
+        else:
+            print(f"❌ Error sending to {chat_id}: {res.text}")
+    except Exception as e:
+        print(f"❌ Exception while sending to {chat_id}: {e}")
+
+async def send_telegram_message(text):
+    import asyncio
+
+    # Fan out to all chats concurrently; the pooled session is thread-safe
+    # for independent requests and keeps one connection per worker alive.
+    await asyncio.gather(*[
+        asyncio.to_thread(_post_telegram, chat_id, text) for chat_id in CHAT_IDS
+    ])
+
+def _post_telegram_in_order(chat_id, messages):
+    for text in messages:
+        _post_telegram(chat_id, text)
+
+async def send_all(messages):
+    import asyncio
+
+    # Chats are independent, but the chunks of one batch must reach each
+    # chat in order, so only the per-chat sequences run concurrently.
+    await asyncio.gather(*[
+        asyncio.to_thread(_post_telegram_in_order, chat_id, messages) for chat_id in CHAT_IDS
+    ])
+
+def chunk_messages(lines, limit=TELEGRAM_MAX_LENGTH, sep="\n\n"):
+    chunks = []
+    current = ""
+    for line in lines:
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if not current:
+            current = line
+        elif len(current) + len(sep) + len(line) <= limit:
+            current += sep + line
+        else:
+            chunks.append(current)
+            current = line
+    if current:
+        chunks.append(current)
+    return chunks
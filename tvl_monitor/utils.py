@@ -0,0 +1,33 @@
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent=False):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+def load_json_file(path, default, label):
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "rb") as f:
+            return json_loads(f.read())
+    except Exception as e:
+        print(f"❌ Error loading {label}: {e}")
+        return default
+
+def write_atomically(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)